@@ -4,8 +4,8 @@ from .models import JobDescription, Candidate, Match
 
 @admin.register(JobDescription)
 class JobDescriptionAdmin(admin.ModelAdmin):
-    list_display = ['title', 'company_name', 'location', 'experience_years', 'created_at']
-    list_filter = ['company_name', 'experience_years', 'created_at']
+    list_display = ['title', 'company_name', 'location', 'experience_years', 'processing_status', 'created_at']
+    list_filter = ['company_name', 'experience_years', 'processing_status', 'created_at']
     search_fields = ['title', 'company_name', 'raw_text']
     readonly_fields = ['raw_text', 'skills_required', 'created_at']
     ordering = ['-created_at']
@@ -13,8 +13,8 @@ class JobDescriptionAdmin(admin.ModelAdmin):
 
 @admin.register(Candidate)
 class CandidateAdmin(admin.ModelAdmin):
-    list_display = ['name', 'email', 'phone', 'experience_years', 'education_level', 'created_at']
-    list_filter = ['education_level', 'experience_years', 'created_at']
+    list_display = ['name', 'email', 'phone', 'experience_years', 'education_level', 'processing_status', 'created_at']
+    list_filter = ['education_level', 'experience_years', 'processing_status', 'created_at']
     search_fields = ['name', 'email', 'raw_text']
     readonly_fields = ['raw_text', 'skills_extracted', 'created_at', 'updated_at']
     ordering = ['-created_at']
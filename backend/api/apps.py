@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = 'api'
+    
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
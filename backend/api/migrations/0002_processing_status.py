@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='processing_status',
+            field=models.CharField(choices=[('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='completed', help_text='State of background PDF text and skill extraction', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='jobdescription',
+            name='processing_status',
+            field=models.CharField(choices=[('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='completed', help_text='State of background PDF text and skill extraction', max_length=20),
+        ),
+    ]
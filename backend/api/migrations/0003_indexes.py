@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-15 11:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_processing_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['-created_at'], name='api_candida_created_404427_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobdescription',
+            index=models.Index(fields=['-created_at'], name='api_jobdesc_created_7e2a23_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['-match_percentage', '-matched_on'], name='api_match_match_p_289278_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['job', '-match_percentage'], name='api_match_job_id_d12a6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['candidate', '-match_percentage'], name='api_match_candida_30e2fd_idx'),
+        ),
+    ]
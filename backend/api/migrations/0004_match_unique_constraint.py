@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-15 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='match',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(fields=('job', 'candidate'), name='unique_job_candidate'),
+        ),
+    ]
@@ -1,6 +1,13 @@
 from django.db import models
 
 
+PROCESSING_STATUS_CHOICES = [
+    ('processing', 'Processing'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+
 class JobDescription(models.Model):
     """
     Stores job descriptions uploaded by recruiters.
@@ -13,12 +20,21 @@ class JobDescription(models.Model):
     raw_text = models.TextField(blank=True)
     skills_required = models.JSONField(default=list)
     experience_years = models.IntegerField(default=0)
+    processing_status = models.CharField(
+        max_length=20,
+        choices=PROCESSING_STATUS_CHOICES,
+        default='completed',
+        help_text="State of background PDF text and skill extraction"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Job Description'
         verbose_name_plural = 'Job Descriptions'
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.title} at {self.company_name}"
@@ -51,6 +67,12 @@ class Candidate(models.Model):
         blank=True,
         null=True
     )
+    processing_status = models.CharField(
+        max_length=20,
+        choices=PROCESSING_STATUS_CHOICES,
+        default='completed',
+        help_text="State of background PDF text and skill extraction"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -58,6 +80,9 @@ class Candidate(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Candidate'
         verbose_name_plural = 'Candidates'
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.email})"
@@ -95,7 +120,16 @@ class Match(models.Model):
         ordering = ['-match_percentage', '-matched_on']
         verbose_name = 'Match'
         verbose_name_plural = 'Matches'
-        unique_together = ['job', 'candidate']  # Prevent duplicate matches
+        constraints = [
+            # Prevent duplicate matches; also the conflict target for bulk upserts
+            models.UniqueConstraint(fields=['job', 'candidate'], name='unique_job_candidate'),
+        ]
+        indexes = [
+            # Back the default ordering and per-job/per-candidate rankings
+            models.Index(fields=['-match_percentage', '-matched_on']),
+            models.Index(fields=['job', '-match_percentage']),
+            models.Index(fields=['candidate', '-match_percentage']),
+        ]
 
     def __str__(self):
         return f"{self.candidate.name} → {self.job.title} ({self.match_percentage:.1f}%)"
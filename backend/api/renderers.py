@@ -0,0 +1,62 @@
+"""
+Response renderers for the ATS system.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used without it
+    orjson = None
+
+
+# orjson flags: serialize numpy values, allow non-string dict keys, and
+# leave datetimes to DRF's encoder so their format matches JSONRenderer
+ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+) if orjson else 0
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, which encodes straight to UTF-8 bytes
+    and is several times faster than the stdlib encoder on large payloads.
+    
+    Falls back to DRF's JSONRenderer when orjson is not installed, the
+    client asks for output orjson cannot produce (indented or ASCII-only),
+    or orjson rejects the data (e.g. integers wider than 64 bits).
+    
+    Unlike JSONRenderer, NaN and Infinity floats are rendered as null
+    rather than raising under STRICT_JSON; scanning every payload for
+    them would cost most of the speedup.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # DRF's encoder handles lazy strings, Decimals, and other types
+        # orjson does not know natively
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # Escape U+2028/U+2029 like JSONRenderer so the output stays a
+        # strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -3,8 +3,10 @@ Serializers for the ATS API.
 Handles serialization/deserialization of JobDescription, Candidate, and Match models.
 """
 
+from django.db import transaction
 from rest_framework import serializers
 from .models import JobDescription, Candidate, Match
+from .tasks import process_job_pdf, process_candidate_cv
 from .utils import (
     extract_text_from_pdf,
     extract_skills,
@@ -17,6 +19,7 @@ class JobDescriptionSerializer(serializers.ModelSerializer):
     """
     Serializer for JobDescription model.
     Automatically extracts text and skills from uploaded PDF.
+    Extraction on create runs in a background task.
     """
     
     class Meta:
@@ -30,32 +33,32 @@ class JobDescriptionSerializer(serializers.ModelSerializer):
             'raw_text',
             'skills_required',
             'experience_years',
+            'processing_status',
+            'created_at',
+        ]
+        read_only_fields = [
+            'id',
+            'raw_text',
+            'skills_required',
+            'processing_status',
             'created_at',
         ]
-        read_only_fields = ['id', 'raw_text', 'skills_required', 'created_at']
     
     def create(self, validated_data):
         """
-        Override create to extract text and skills from PDF.
+        Override create to queue text and skill extraction from PDF.
         """
-        pdf_file = validated_data.get('file')
+        if not validated_data.get('file'):
+            return super().create(validated_data)
         
-        if pdf_file:
-            # Extract text from PDF
-            raw_text = extract_text_from_pdf(pdf_file)
-            validated_data['raw_text'] = raw_text
-            
-            # Extract skills from text
-            skills = extract_skills(raw_text)
-            validated_data['skills_required'] = skills
-            
-            # Extract experience years if not provided or is default
-            if validated_data.get('experience_years', 0) == 0:
-                experience = extract_experience_years(raw_text)
-                if experience > 0:
-                    validated_data['experience_years'] = int(experience)
+        validated_data['processing_status'] = 'processing'
+        job = super().create(validated_data)
         
-        return super().create(validated_data)
+        # Runs inline when no Celery broker is configured
+        transaction.on_commit(lambda: process_job_pdf.delay(job.id))
+        job.refresh_from_db()
+        
+        return job
     
     def update(self, instance, validated_data):
         """
@@ -71,6 +74,9 @@ class JobDescriptionSerializer(serializers.ModelSerializer):
             # Extract skills from text
             skills = extract_skills(raw_text)
             validated_data['skills_required'] = skills
+            
+            # Same status rule as the background task
+            validated_data['processing_status'] = 'completed' if raw_text else 'failed'
         
         return super().update(instance, validated_data)
 
@@ -90,6 +96,7 @@ class JobDescriptionListSerializer(serializers.ModelSerializer):
             'location',
             'experience_years',
             'skills_count',
+            'processing_status',
             'created_at',
         ]
     
@@ -101,6 +108,7 @@ class CandidateSerializer(serializers.ModelSerializer):
     """
     Serializer for Candidate model.
     Automatically extracts text, skills, experience, and education from uploaded CV.
+    Extraction on create runs in a background task.
     """
     
     class Meta:
@@ -115,6 +123,7 @@ class CandidateSerializer(serializers.ModelSerializer):
             'skills_extracted',
             'experience_years',
             'education_level',
+            'processing_status',
             'created_at',
             'updated_at',
         ]
@@ -122,37 +131,26 @@ class CandidateSerializer(serializers.ModelSerializer):
             'id',
             'raw_text',
             'skills_extracted',
+            'processing_status',
             'created_at',
             'updated_at',
         ]
     
     def create(self, validated_data):
         """
-        Override create to extract text, skills, experience, and education from CV.
+        Override create to queue text, skills, experience, and education extraction from CV.
         """
-        pdf_file = validated_data.get('file')
+        if not validated_data.get('file'):
+            return super().create(validated_data)
         
-        if pdf_file:
-            # Extract text from PDF
-            raw_text = extract_text_from_pdf(pdf_file)
-            validated_data['raw_text'] = raw_text
-            
-            # Extract skills from text
-            skills = extract_skills(raw_text)
-            validated_data['skills_extracted'] = skills
-            
-            # Extract experience years if not provided
-            if validated_data.get('experience_years', 0.0) == 0.0:
-                experience = extract_experience_years(raw_text)
-                validated_data['experience_years'] = experience
-            
-            # Extract education level if not provided
-            if not validated_data.get('education_level'):
-                education = extract_education_level(raw_text)
-                if education:
-                    validated_data['education_level'] = education
+        validated_data['processing_status'] = 'processing'
+        candidate = super().create(validated_data)
         
-        return super().create(validated_data)
+        # Runs inline when no Celery broker is configured
+        transaction.on_commit(lambda: process_candidate_cv.delay(candidate.id))
+        candidate.refresh_from_db()
+        
+        return candidate
     
     def update(self, instance, validated_data):
         """
@@ -179,6 +177,9 @@ class CandidateSerializer(serializers.ModelSerializer):
                 education = extract_education_level(raw_text)
                 if education:
                     validated_data['education_level'] = education
+            
+            # Same status rule as the background task
+            validated_data['processing_status'] = 'completed' if raw_text else 'failed'
         
         return super().update(instance, validated_data)
 
@@ -199,6 +200,7 @@ class CandidateListSerializer(serializers.ModelSerializer):
             'experience_years',
             'education_level',
             'skills_count',
+            'processing_status',
             'created_at',
         ]
     
@@ -0,0 +1,38 @@
+"""
+Signal handlers for the ATS system.
+Keeps the cached dashboard statistics in step with the underlying data.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import JobDescription, Candidate, Match
+
+
+# Cache key and lifetime (seconds) for the dashboard statistics response
+DASHBOARD_STATS_CACHE_KEY = 'dashboard:stats:v1'
+DASHBOARD_STATS_CACHE_TIMEOUT = 30
+
+
+def invalidate_dashboard_stats():
+    """
+    Drop the cached dashboard statistics so the next request recomputes them.
+    """
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+@receiver(post_save, sender=JobDescription)
+@receiver(post_save, sender=Candidate)
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=JobDescription)
+@receiver(post_delete, sender=Candidate)
+@receiver(post_delete, sender=Match)
+def dashboard_data_changed(sender, **kwargs):
+    """
+    Invalidate the dashboard statistics whenever a job, candidate, or
+    match is saved or deleted. Runs after commit, so a request landing in
+    between cannot cache the pre-commit numbers again.
+    """
+    transaction.on_commit(invalidate_dashboard_stats)
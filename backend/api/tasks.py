@@ -0,0 +1,100 @@
+"""
+Background tasks for the ATS system.
+Runs CPU-heavy PDF text and skill extraction outside the request cycle.
+"""
+
+from celery import shared_task
+
+from .models import JobDescription, Candidate
+from .utils import (
+    extract_text_from_pdf,
+    extract_skills,
+    extract_experience_years,
+    extract_education_level,
+)
+
+
+@shared_task
+def process_job_pdf(job_id):
+    """
+    Extract text, skills, and experience from a job description PDF.
+    
+    Args:
+        job_id: Primary key of the JobDescription to process.
+    """
+    try:
+        job = JobDescription.objects.get(pk=job_id)
+    except JobDescription.DoesNotExist:
+        return
+    
+    try:
+        with job.file.open('rb') as pdf_file:
+            raw_text = extract_text_from_pdf(pdf_file)
+        job.raw_text = raw_text
+        
+        # Extract skills from text
+        job.skills_required = extract_skills(raw_text)
+        
+        # Extract experience years if not provided or is default
+        if job.experience_years == 0:
+            experience = extract_experience_years(raw_text)
+            if experience > 0:
+                job.experience_years = int(experience)
+        
+        job.processing_status = 'completed' if raw_text else 'failed'
+        job.save(update_fields=[
+            'raw_text',
+            'skills_required',
+            'experience_years',
+            'processing_status',
+        ])
+    except Exception:
+        # Never leave the job stuck in 'processing'
+        JobDescription.objects.filter(pk=job_id).update(processing_status='failed')
+        raise
+
+
+@shared_task
+def process_candidate_cv(candidate_id):
+    """
+    Extract text, skills, experience, and education from a candidate CV.
+    
+    Args:
+        candidate_id: Primary key of the Candidate to process.
+    """
+    try:
+        candidate = Candidate.objects.get(pk=candidate_id)
+    except Candidate.DoesNotExist:
+        return
+    
+    try:
+        with candidate.file.open('rb') as pdf_file:
+            raw_text = extract_text_from_pdf(pdf_file)
+        candidate.raw_text = raw_text
+        
+        # Extract skills from text
+        candidate.skills_extracted = extract_skills(raw_text)
+        
+        # Extract experience years if not provided
+        if candidate.experience_years == 0.0:
+            candidate.experience_years = extract_experience_years(raw_text)
+        
+        # Extract education level if not provided
+        if not candidate.education_level:
+            education = extract_education_level(raw_text)
+            if education:
+                candidate.education_level = education
+        
+        candidate.processing_status = 'completed' if raw_text else 'failed'
+        candidate.save(update_fields=[
+            'raw_text',
+            'skills_extracted',
+            'experience_years',
+            'education_level',
+            'processing_status',
+            'updated_at',
+        ])
+    except Exception:
+        # Never leave the candidate stuck in 'processing'
+        Candidate.objects.filter(pk=candidate_id).update(processing_status='failed')
+        raise
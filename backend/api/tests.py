@@ -1,3 +1,257 @@
-from django.test import TestCase
+"""
+Tests for the ATS API.
+"""
 
-# Create your tests here.
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from .models import JobDescription, Candidate, Match
+from .renderers import ORJSONRenderer
+from .serializers import CandidateSerializer
+from .tasks import process_candidate_cv
+from .utils import (
+    extract_skills,
+    extract_text_from_pdf,
+    calculate_skill_match,
+    bulk_calculate_skill_match,
+)
+from .signals import DASHBOARD_STATS_CACHE_KEY, invalidate_dashboard_stats
+from .views import _upsert_matches
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_upload(name='cv.pdf'):
+    return SimpleUploadedFile(name, b'%PDF-1.4 test', content_type='application/pdf')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ProcessingStatusTests(TestCase):
+    """
+    processing_status must always settle on completed or failed.
+    """
+    
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+    
+    def make_candidate(self, status):
+        return Candidate.objects.create(
+            name='Jane Doe',
+            email='jane@example.com',
+            file=make_upload(),
+            processing_status=status,
+        )
+    
+    def test_task_marks_candidate_failed_on_error(self):
+        candidate = self.make_candidate('processing')
+        
+        with mock.patch('api.tasks.extract_text_from_pdf', side_effect=OSError):
+            with self.assertRaises(OSError):
+                process_candidate_cv(candidate.id)
+        
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.processing_status, 'failed')
+    
+    def test_update_with_new_file_sets_status(self):
+        candidate = self.make_candidate('failed')
+        
+        with mock.patch('api.serializers.extract_text_from_pdf', return_value='Python and Django developer'):
+            serializer = CandidateSerializer(candidate, data={'file': make_upload()}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            candidate = serializer.save()
+        
+        self.assertEqual(candidate.processing_status, 'completed')
+        self.assertEqual(candidate.skills_extracted, ['django', 'python'])
+        
+        with mock.patch('api.serializers.extract_text_from_pdf', return_value=''):
+            serializer = CandidateSerializer(candidate, data={'file': make_upload()}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            candidate = serializer.save()
+        
+        self.assertEqual(candidate.processing_status, 'failed')
+
+
+class SkillExtractionTests(TestCase):
+    """
+    Skills are detected only when they stand alone in the text.
+    """
+    
+    def test_symbol_skills_are_found(self):
+        skills = extract_skills('Senior C++ and C# engineer, .NET and Python')
+        
+        for skill in ('c++', 'c#', '.net', 'python'):
+            self.assertIn(skill, skills)
+    
+    def test_skill_inside_longer_word_is_rejected(self):
+        skills = extract_skills('Frontend work in JavaScript and TypeScript')
+        
+        self.assertIn('javascript', skills)
+        self.assertNotIn('java', skills)
+
+
+class CacheOutageTests(TestCase):
+    """
+    An unreachable cache backend falls through to computing the value.
+    """
+    
+    def test_extraction_works_without_cache(self):
+        with mock.patch('api.utils.cache.get', side_effect=ConnectionError), \
+                mock.patch('api.utils.cache.set', side_effect=ConnectionError), \
+                mock.patch('api.utils._extract_raw_pdf_text', return_value='Rust engineer'):
+            skills = extract_skills('Backend engineer using Rust and Go')
+            text = extract_text_from_pdf(b'%PDF-1.4 test')
+        
+        self.assertIn('rust', skills)
+        self.assertEqual(text, 'Rust engineer')
+
+
+class SkillMatchTests(TestCase):
+    """
+    The vectorized bulk scorer must agree with the per-pair scorer.
+    """
+    
+    def test_bulk_scores_equal_pair_scores(self):
+        job_skills = ['Python', 'React.js', 'Docker', 'Kubernetes', 'C++', 'PostgreSQL']
+        candidate_skill_lists = [
+            ['python', 'reactjs', 'docker'],
+            ['Pythn', 'k8s', 'postgres'],
+            ['c++', 'node.js', 'aws'],
+            ['java'],
+            [],
+        ]
+        
+        bulk_scores = bulk_calculate_skill_match(job_skills, candidate_skill_lists)
+        pair_scores = [
+            calculate_skill_match(job_skills, candidate_skills)
+            for candidate_skills in candidate_skill_lists
+        ]
+        
+        self.assertEqual(bulk_scores, pair_scores)
+
+
+class UpsertMatchesTests(TestCase):
+    """
+    Re-scoring a job/candidate pair updates its Match row in place.
+    """
+    
+    def test_existing_pair_is_updated(self):
+        job = JobDescription.objects.create(title='Engineer', company_name='Acme', file='jds/jd.pdf')
+        candidate = Candidate.objects.create(name='Jane Doe', email='jane@example.com', file='cvs/cv.pdf')
+        
+        _upsert_matches([Match(job=job, candidate=candidate, match_percentage=50.0, keyword_matches={'python': True})])
+        _upsert_matches([Match(job=job, candidate=candidate, match_percentage=80.0, keyword_matches={'python': True, 'django': True})])
+        
+        match = Match.objects.get(job=job, candidate=candidate)
+        self.assertEqual(Match.objects.count(), 1)
+        self.assertEqual(match.match_percentage, 80.0)
+        self.assertEqual(match.keyword_matches, {'python': True, 'django': True})
+    
+    def test_dashboard_stats_invalidated_after_commit(self):
+        job = JobDescription.objects.create(title='Engineer', company_name='Acme', file='jds/jd.pdf')
+        candidate = Candidate.objects.create(name='Jane Doe', email='jane@example.com', file='cvs/cv.pdf')
+        cache.set(DASHBOARD_STATS_CACHE_KEY, {'total_matches': 0})
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            _upsert_matches([Match(job=job, candidate=candidate, match_percentage=50.0)])
+            self.assertIsNotNone(cache.get(DASHBOARD_STATS_CACHE_KEY))
+        
+        self.assertIsNone(cache.get(DASHBOARD_STATS_CACHE_KEY))
+    
+    def test_bulk_create_invalidates_once(self):
+        for title in ('Engineer', 'Designer', 'Manager'):
+            JobDescription.objects.create(title=title, company_name='Acme', file='jds/jd.pdf')
+        Candidate.objects.create(name='Jane Doe', email='jane@example.com', file='cvs/cv.pdf')
+        
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = APIClient().post('/api/matches/bulk_create/')
+        
+        self.assertEqual(response.data['total_jobs'], 3)
+        self.assertEqual(callbacks.count(invalidate_dashboard_stats), 1)
+
+
+class CVScoreHighlightTests(TestCase):
+    """
+    check_score highlights every matched skill, including symbol skills.
+    """
+    
+    def test_symbol_skills_are_highlighted(self):
+        cv_text = 'Senior C++ and C# engineer, .NET and Python'
+        
+        with mock.patch('api.views.extract_text_from_pdf', return_value=cv_text):
+            response = APIClient().post(
+                '/api/cv-checker/check_score/',
+                {'cv_file': make_upload(), 'required_skills': 'c++, c#, .net, python'},
+                format='multipart',
+            )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(response.data['matched_skills'], ['c++', 'c#', '.net', 'python'])
+        highlighted = {
+            cv_text[highlight['start']:highlight['end']]: highlight['type']
+            for highlight in response.data['highlights']
+        }
+        self.assertEqual(highlighted, {
+            'C++': 'skill_match',
+            'C#': 'skill_match',
+            '.NET': 'skill_match',
+            'Python': 'skill_match',
+        })
+
+
+class MatchReadinessTests(TestCase):
+    """
+    Matching only scores jobs and candidates whose extraction completed.
+    """
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.job = JobDescription.objects.create(
+            title='Engineer', company_name='Acme', file='jds/jd.pdf', skills_required=['python'],
+        )
+        self.ready = Candidate.objects.create(
+            name='Ready', email='ready@example.com', file='cvs/a.pdf', skills_extracted=['python'],
+        )
+        self.pending = Candidate.objects.create(
+            name='Pending', email='pending@example.com', file='cvs/b.pdf', processing_status='processing',
+        )
+    
+    def test_unprocessed_candidates_are_skipped(self):
+        response = self.client.post(f'/api/jobs/{self.job.id}/match_candidates/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_candidates'], 1)
+        self.assertEqual(list(Match.objects.values_list('candidate_id', flat=True)), [self.ready.id])
+    
+    def test_unprocessed_job_or_candidate_is_rejected(self):
+        self.job.processing_status = 'processing'
+        self.job.save()
+        
+        response = self.client.post(f'/api/jobs/{self.job.id}/match_candidates/')
+        self.assertEqual(response.status_code, 409)
+        
+        response = self.client.post(
+            '/api/candidates/match_all_jobs/', {'candidate_id': self.pending.id}, format='json'
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Match.objects.exists())
+
+
+class ORJSONRendererTests(TestCase):
+    """
+    ORJSONRenderer output matches JSONRenderer, including its fallbacks.
+    """
+    
+    def test_wide_integer_falls_back(self):
+        data = {'id': 2 ** 70, 'name': 'Acme'}
+        
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
@@ -4,20 +4,55 @@ Enhanced with synonym matching, fuzzy matching, and weighted scoring.
 """
 
 import re
-import spacy
+import hashlib
+import functools
+import logging
+from collections import defaultdict
+from types import MappingProxyType
+import ahocorasick
+import numpy as np
+from django.core.cache import cache
 from pdfminer.high_level import extract_text
-from io import BytesIO
-from difflib import SequenceMatcher
+from io import BytesIO, IOBase
+from rapidfuzz import fuzz, process
 
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF is optional; pdfminer is used without it
+    pymupdf = None
 
-# Load SpaCy model (loaded once at module level for performance)
 try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    # If model not found, download it
-    import subprocess
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
+    from redis.exceptions import RedisError
+except ImportError:  # redis is optional; the local-memory cache is used without it
+    RedisError = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Extracted PDF text is cached by content hash so re-uploads skip parsing
+PDF_TEXT_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+
+# Block size used when hashing uploaded PDFs
+PDF_HASH_CHUNK_SIZE = 64 * 1024
+
+# Bump when clean_text or the PDF parsing changes, so cached text from the
+# old logic is no longer served; the active PDF backend is part of the key
+PDF_TEXT_CACHE_LOGIC_VERSION = 1
+PDF_TEXT_CACHE_VERSION = f"{PDF_TEXT_CACHE_LOGIC_VERSION}-{'pymupdf' if pymupdf else 'pdfminer'}"
+
+# Skill, experience, and education extraction results are cached by text hash
+TEXT_ANALYSIS_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
+
+# Per-process LRU size for text analysis results, checked before the shared cache
+TEXT_ANALYSIS_LRU_SIZE = 256
+
+# Marks a cache miss, since None is a valid cached result
+_CACHE_MISS = object()
+
+# Cache backend failures that are logged and treated as a miss, so an
+# unreachable cache only costs the recomputation
+CACHE_BACKEND_ERRORS = (RedisError, OSError) if RedisError else (OSError,)
 
 
 # ============================================================================
@@ -178,12 +213,21 @@ SKILL_SYNONYMS = {
     "jr.": "junior",
 }
 
+def _build_canonical_to_synonyms():
+    """
+    Build the read-only reverse synonym map (canonical -> frozenset of synonyms).
+    """
+    canonical_to_synonyms = defaultdict(set)
+    for synonym, canonical in SKILL_SYNONYMS.items():
+        canonical_to_synonyms[canonical].add(synonym)
+    return MappingProxyType({
+        canonical: frozenset(synonyms)
+        for canonical, synonyms in canonical_to_synonyms.items()
+    })
+
+
 # Reverse synonym map for lookups
-CANONICAL_TO_SYNONYMS = {}
-for synonym, canonical in SKILL_SYNONYMS.items():
-    if canonical not in CANONICAL_TO_SYNONYMS:
-        CANONICAL_TO_SYNONYMS[canonical] = set()
-    CANONICAL_TO_SYNONYMS[canonical].add(synonym)
+CANONICAL_TO_SYNONYMS = _build_canonical_to_synonyms()
 
 
 # ============================================================================
@@ -292,13 +336,220 @@ TECH_SKILLS = [
     "snowflake", "redshift", "bigquery", "dbt", "fivetran", "stitch",
 ]
 
-# Convert to lowercase set for faster lookup
-TECH_SKILLS_SET = set(skill.lower() for skill in TECH_SKILLS)
+
+def _build_skill_automaton():
+    """
+    Build an Aho-Corasick automaton over all predefined tech skills and
+    skill synonyms.
+    
+    Each keyword maps to (keyword_length, canonical_skill) so a hit can be
+    located in the text and normalized without further lookups.
+    
+    Returns:
+        ahocorasick.Automaton: Automaton ready for iteration.
+    """
+    automaton = ahocorasick.Automaton()
+    for skill in TECH_SKILLS:
+        skill_lower = skill.lower()
+        canonical = SKILL_SYNONYMS.get(skill_lower, skill_lower)
+        automaton.add_word(skill_lower, (len(skill_lower), canonical))
+    for synonym, canonical in SKILL_SYNONYMS.items():
+        synonym_lower = synonym.lower()
+        automaton.add_word(synonym_lower, (len(synonym_lower), canonical))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import time (the import lock makes this thread-safe)
+SKILL_AUTOMATON = _build_skill_automaton()
+
+# Characters stripped by clean_text (punctuation useful for NLP is kept)
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\,\;\:\!\?\-\+\#\@\(\)\[\]\/]+')
+
+
+class _SpecialCharsTable(dict):
+    """
+    str.translate table that deletes the characters SPECIAL_CHARS_PATTERN
+    matches.
+    
+    Code points are classified with the pattern the first time they are
+    seen, so the table follows the same Unicode rules. Only code points in
+    the Basic Multilingual Plane are memoized, which bounds its size for
+    arbitrary uploaded text.
+    """
+    def __missing__(self, code):
+        value = None if SPECIAL_CHARS_PATTERN.match(chr(code)) else code
+        if code <= 0xFFFF:
+            self[code] = value
+        return value
+
+
+SPECIAL_CHARS_TABLE = _SpecialCharsTable()
+
+# Common patterns for years of experience.
+# Experience and education patterns match case-insensitively, so the
+# text does not need a lowercased copy.
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)', re.IGNORECASE),
+    re.compile(r'(?:experience|exp)(?:\s*:)?\s*(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE),
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+(?:in|of|working))', re.IGNORECASE),
+    re.compile(r'(?:over|more than|approximately|about|around)\s*(\d+)\s*(?:years?|yrs?)', re.IGNORECASE),
+]
+
+# Upper bound of a plausible experience figure; larger numbers are ignored
+MAX_EXPERIENCE_YEARS = 50
+
+# Education level patterns, ordered from highest to lowest.
+# Each level's alternatives are joined into a single regex.
+EDUCATION_PATTERNS = {
+    level: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    for level, patterns in {
+        'phd': [r'\bph\.?d\.?\b', r'\bdoctorate\b', r'\bdoctoral\b'],
+        'master': [r'\bmaster\'?s?\b', r'\bm\.?s\.?\b', r'\bm\.?a\.?\b', r'\bmba\b', r'\bm\.?tech\b'],
+        'bachelor': [r'\bbachelor\'?s?\b', r'\bb\.?s\.?\b', r'\bb\.?a\.?\b', r'\bb\.?tech\b', r'\bb\.?e\.?\b'],
+        'associate': [r'\bassociate\'?s?\b', r'\ba\.?s\.?\b', r'\ba\.?a\.?\b'],
+        'high_school': [r'\bhigh school\b', r'\bh\.?s\.?\b', r'\bdiploma\b', r'\bged\b'],
+    }.items()
+}
+
+
+def _is_word_char(char):
+    """Return True if char is a word character (letter, digit or underscore)."""
+    return char.isalnum() or char == '_'
+
+
+def _is_standalone(text, start, end):
+    """
+    Check that text[start:end] is not glued to surrounding word characters.
+    
+    e.g., "java" inside "javascript" is rejected, while "c++" followed by
+    a space or punctuation is accepted.
+    """
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def _extraction_tables_digest():
+    """
+    Digest of the skill tables and patterns the cached extractors read, so
+    editing any of them changes the cache version automatically.
+    """
+    hasher = hashlib.sha1()
+    for part in (
+        sorted(TECH_SKILLS),
+        sorted(SKILL_SYNONYMS.items()),
+        [(pattern.pattern, pattern.flags) for pattern in EXPERIENCE_PATTERNS],
+        MAX_EXPERIENCE_YEARS,
+        [(level, pattern.pattern, pattern.flags) for level, pattern in EDUCATION_PATTERNS.items()],
+    ):
+        hasher.update(repr(part).encode())
+    return hasher.hexdigest()[:12]
+
+
+# Bump when the extraction logic changes; edits to the skill tables and
+# patterns are picked up by the digest, so old cached results are not served
+EXTRACTION_CACHE_LOGIC_VERSION = 1
+EXTRACTION_CACHE_VERSION = f"{EXTRACTION_CACHE_LOGIC_VERSION}-{_extraction_tables_digest()}"
+
+
+def _cache_get(key, version):
+    """
+    Read a value from the shared cache, treating backend errors as a miss.
+    
+    Args:
+        key: Cache key
+        version: Cache key version
+        
+    Returns:
+        The cached value, or _CACHE_MISS if absent or the cache is unavailable
+    """
+    try:
+        return cache.get(key, _CACHE_MISS, version=version)
+    except CACHE_BACKEND_ERRORS as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return _CACHE_MISS
+
+
+def _cache_set(key, value, timeout, version):
+    """
+    Write a value to the shared cache, logging and ignoring backend errors.
+    
+    Args:
+        key: Cache key
+        value: Value to store
+        timeout: Lifetime in seconds
+        version: Cache key version
+    """
+    try:
+        cache.set(key, value, timeout, version=version)
+    except CACHE_BACKEND_ERRORS as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+def _cache_by_text_hash(func):
+    """
+    Cache the result of a text analysis function by the SHA-1 of its input,
+    so re-analyzing identical text costs one cache lookup. Entries are
+    stored under EXTRACTION_CACHE_VERSION.
+    
+    Recent results are also kept in a per-process LRU, which avoids the
+    hash and the shared cache round trip when the same text is analyzed
+    repeatedly. List results are stored as tuples and copied back out, so
+    callers cannot mutate the memoized value.
+    """
+    @functools.lru_cache(maxsize=TEXT_ANALYSIS_LRU_SIZE)
+    def cached(text):
+        cache_key = f"{func.__name__}:{hashlib.sha1(text.encode()).hexdigest()}"
+        result = _cache_get(cache_key, EXTRACTION_CACHE_VERSION)
+        if result is _CACHE_MISS:
+            result = func(text)
+            _cache_set(cache_key, result, TEXT_ANALYSIS_CACHE_TIMEOUT, EXTRACTION_CACHE_VERSION)
+        return tuple(result) if isinstance(result, list) else result
+    
+    @functools.wraps(func)
+    def wrapper(text):
+        if not text:
+            return func(text)
+        
+        result = cached(text)
+        return list(result) if isinstance(result, tuple) else result
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _extract_raw_pdf_text(pdf_source):
+    """
+    Extract raw text from a PDF with PyMuPDF, or pdfminer if PyMuPDF
+    is not installed.
+    
+    Args:
+        pdf_source: A file path or a binary file object.
+        
+    Returns:
+        str: Raw text of all pages.
+    """
+    if pymupdf is None:
+        return extract_text(pdf_source)
+    
+    if isinstance(pdf_source, str):
+        doc = pymupdf.open(pdf_source)
+    else:
+        doc = pymupdf.open(stream=pdf_source.read(), filetype='pdf')
+    
+    with doc:
+        return '\n'.join(page.get_text('text') for page in doc)
 
 
 def extract_text_from_pdf(pdf_file):
     """
     Extract text content from a PDF file.
+    Results are cached by the SHA-256 of the file content, so identical
+    uploads are only parsed once.
     
     Args:
         pdf_file: A Django FileField file object or file-like object.
@@ -307,24 +558,45 @@ def extract_text_from_pdf(pdf_file):
         str: Cleaned text extracted from the PDF.
     """
     try:
-        # Read the file content into a BytesIO object
         if hasattr(pdf_file, 'read'):
-            # Reset file pointer to beginning
+            # Hash the file in blocks instead of reading it into memory
+            pdf_file.seek(0)
+            hasher = hashlib.sha256()
+            for block in iter(lambda: pdf_file.read(PDF_HASH_CHUNK_SIZE), b''):
+                hasher.update(block)
             pdf_file.seek(0)
-            file_content = pdf_file.read()
-            pdf_file.seek(0)  # Reset again for potential future reads
-        else:
-            file_content = pdf_file
             
-        # Create a BytesIO object for pdfminer
-        pdf_bytes = BytesIO(file_content)
+            # Uploads spooled to disk are parsed straight from their path;
+            # Django File wrappers are unwrapped to the stream underneath,
+            # since pdfminer only accepts real file objects
+            if hasattr(pdf_file, 'temporary_file_path'):
+                pdf_source = pdf_file.temporary_file_path()
+            else:
+                pdf_source = pdf_file
+                while not isinstance(pdf_source, IOBase) and hasattr(pdf_source, 'file'):
+                    pdf_source = pdf_source.file
+                if not isinstance(pdf_source, IOBase):
+                    pdf_source = BytesIO(pdf_file.read())
+        else:
+            hasher = hashlib.sha256(pdf_file)
+            pdf_source = BytesIO(pdf_file)
+        
+        # Return cached text if this exact file was parsed before
+        cache_key = f"pdf_text:{hasher.hexdigest()}"
+        cached_text = _cache_get(cache_key, PDF_TEXT_CACHE_VERSION)
+        if cached_text is not _CACHE_MISS:
+            return cached_text
         
-        # Extract text using pdfminer
-        raw_text = extract_text(pdf_bytes)
+        # Extract text (PyMuPDF, falling back to pdfminer)
+        raw_text = _extract_raw_pdf_text(pdf_source)
+        if hasattr(pdf_file, 'seek'):
+            pdf_file.seek(0)  # Reset for potential future reads
         
         # Clean the extracted text
         cleaned_text = clean_text(raw_text)
         
+        _cache_set(cache_key, cleaned_text, PDF_TEXT_CACHE_TIMEOUT, PDF_TEXT_CACHE_VERSION)
+        
         return cleaned_text
         
     except Exception as e:
@@ -345,22 +617,67 @@ def clean_text(text):
     if not text:
         return ""
     
-    # Replace multiple whitespace/newlines with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
     # Remove special characters that might interfere with processing
     # but keep punctuation that's useful for NLP
-    text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\+\#\@\(\)\[\]\/]', '', text)
+    # (str.translate is a single C pass, with a fast path for ASCII text)
+    text = text.translate(SPECIAL_CHARS_TABLE)
     
-    return text
+    # Collapse whitespace/newlines to single spaces and trim the ends
+    return ' '.join(text.split())
 
 
+def find_highlights(text, terms):
+    """
+    Find non-overlapping standalone occurrences of terms in text.
+    
+    A term must not be glued to word characters on either side, the same
+    rule extract_skills applies (see _is_standalone), so terms that start
+    or end with a symbol such as "c++", "c#" or ".net" are found too.
+    
+    All terms are joined into one case-insensitive alternation, so the
+    text is scanned once. At each position the first term (in the order
+    given) that matches wins, and scanning resumes after it; earlier
+    terms therefore take priority over later ones. The original text is
+    scanned directly, so no lowercased copy is made and offsets always
+    line up with it.
+    
+    Args:
+        text: Text to search.
+        terms: Dict mapping each lowercase term to the fields added to
+            its highlights, in priority order.
+        
+    Returns:
+        list: Highlight dicts with start, end, and text plus the term's
+        fields, ordered by position.
+    """
+    details = [fields for term, fields in terms.items() if term]
+    if not details:
+        return []
+    
+    # One capturing group per term; lastindex identifies the term matched.
+    # Lookarounds instead of \b, which needs a word character at the edge.
+    pattern = re.compile(
+        r'(?<!\w)(?:' + '|'.join(f'({re.escape(term)})' for term in terms if term) + r')(?!\w)',
+        re.IGNORECASE
+    )
+    
+    highlights = []
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        highlights.append({
+            'start': start,
+            'end': end,
+            'text': text[start:end],
+            **details[match.lastindex - 1],
+        })
+    
+    return highlights
+
+
+@_cache_by_text_hash
 def extract_skills(text):
     """
-    Extract technical skills from text using SpaCy NER and predefined skill matching.
+    Extract technical skills from text using predefined skill matching.
     Enhanced with synonym normalization.
     
     Args:
@@ -373,48 +690,29 @@ def extract_skills(text):
         return []
     
     found_skills = set()
-    
-    # Method 1: Match against predefined tech skills list
     text_lower = text.lower()
     
-    # Check for each skill in our predefined list
-    for skill in TECH_SKILLS:
-        skill_lower = skill.lower()
-        # Use word boundary matching to avoid partial matches
-        # e.g., "java" shouldn't match "javascript"
-        pattern = r'\b' + re.escape(skill_lower) + r'\b'
-        if re.search(pattern, text_lower):
-            # Normalize to canonical form if it's a synonym
-            canonical = SKILL_SYNONYMS.get(skill_lower, skill_lower)
-            found_skills.add(canonical)
-    
-    # Method 2: Check for synonyms directly in text
-    for synonym, canonical in SKILL_SYNONYMS.items():
-        pattern = r'\b' + re.escape(synonym.lower()) + r'\b'
-        if re.search(pattern, text_lower):
+    # Single linear pass over the text finds every predefined skill and
+    # synonym; hits glued to other word characters are discarded
+    # e.g., "java" shouldn't match "javascript"
+    for end, (length, canonical) in SKILL_AUTOMATON.iter(text_lower):
+        if _is_standalone(text_lower, end - length + 1, end + 1):
             found_skills.add(canonical)
     
-    # Method 3: Use SpaCy NER for additional entity extraction
-    doc = nlp(text[:100000])  # Limit text length for performance
-    
-    for ent in doc.ents:
-        # Check if entity might be a tech skill
-        if ent.label_ in ['ORG', 'PRODUCT', 'WORK_OF_ART']:
-            ent_lower = ent.text.lower().strip()
-            # Only add if it looks like a tech term (not too long, not too short)
-            if 2 <= len(ent_lower) <= 30:
-                # Check if it matches any of our known skills
-                if ent_lower in TECH_SKILLS_SET:
-                    canonical = SKILL_SYNONYMS.get(ent_lower, ent_lower)
-                    found_skills.add(canonical)
-    
     # Convert to sorted list for consistent output
-    return sorted(list(found_skills), key=str.lower)
+    # (automaton payloads are all lowercase, so no sort key is needed)
+    return sorted(found_skills)
+
+
+# Number of distinct skill strings whose canonical form is memoized
+NORMALIZE_SKILL_CACHE_SIZE = 4096
 
 
+@functools.lru_cache(maxsize=NORMALIZE_SKILL_CACHE_SIZE)
 def normalize_skill(skill):
     """
     Normalize a skill to its canonical form using synonyms.
+    Results are memoized, since the same skill strings recur across matches.
     
     Args:
         skill: Skill string to normalize.
@@ -426,42 +724,7 @@ def normalize_skill(skill):
     return SKILL_SYNONYMS.get(skill_lower, skill_lower)
 
 
-def fuzzy_match_skill(skill, skill_list, threshold=0.85):
-    """
-    Find the best fuzzy match for a skill in a list.
-    
-    Args:
-        skill: Skill to match.
-        skill_list: List of skills to match against.
-        threshold: Minimum similarity ratio (0-1).
-        
-    Returns:
-        tuple: (matched_skill, similarity_ratio) or (None, 0) if no match.
-    """
-    skill_lower = skill.lower()
-    best_match = None
-    best_ratio = 0
-    
-    for candidate in skill_list:
-        candidate_lower = candidate.lower()
-        
-        # Exact match
-        if skill_lower == candidate_lower:
-            return candidate, 1.0
-        
-        # Check synonyms
-        if normalize_skill(skill_lower) == normalize_skill(candidate_lower):
-            return candidate, 1.0
-        
-        # Fuzzy match using SequenceMatcher
-        ratio = SequenceMatcher(None, skill_lower, candidate_lower).ratio()
-        if ratio > best_ratio and ratio >= threshold:
-            best_match = candidate
-            best_ratio = ratio
-    
-    return best_match, best_ratio
-
-
+@_cache_by_text_hash
 def extract_experience_years(text):
     """
     Extract years of experience from text.
@@ -475,31 +738,25 @@ def extract_experience_years(text):
     if not text:
         return 0.0
     
-    text_lower = text.lower()
-    
-    # Common patterns for years of experience
-    patterns = [
-        r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)',
-        r'(?:experience|exp)(?:\s*:)?\s*(\d+)\+?\s*(?:years?|yrs?)',
-        r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+(?:in|of|working))',
-        r'(?:over|more than|approximately|about|around)\s*(\d+)\s*(?:years?|yrs?)',
-    ]
-    
     max_years = 0.0
     
-    for pattern in patterns:
-        matches = re.findall(pattern, text_lower)
-        for match in matches:
+    for pattern in EXPERIENCE_PATTERNS:
+        for match in pattern.finditer(text):
             try:
-                years = float(match)
-                if 0 < years <= 50:  # Reasonable range
+                years = float(match.group(1))
+                if 0 < years <= MAX_EXPERIENCE_YEARS:  # Reasonable range
                     max_years = max(max_years, years)
             except ValueError:
                 continue
+            
+            # Nothing later can exceed the cap
+            if max_years == MAX_EXPERIENCE_YEARS:
+                return max_years
     
     return max_years
 
 
+@_cache_by_text_hash
 def extract_education_level(text):
     """
     Extract education level from text.
@@ -513,29 +770,47 @@ def extract_education_level(text):
     if not text:
         return None
     
-    text_lower = text.lower()
-    
     # Check from highest to lowest
-    education_patterns = {
-        'phd': [r'\bph\.?d\.?\b', r'\bdoctorate\b', r'\bdoctoral\b'],
-        'master': [r'\bmaster\'?s?\b', r'\bm\.?s\.?\b', r'\bm\.?a\.?\b', r'\bmba\b', r'\bm\.?tech\b'],
-        'bachelor': [r'\bbachelor\'?s?\b', r'\bb\.?s\.?\b', r'\bb\.?a\.?\b', r'\bb\.?tech\b', r'\bb\.?e\.?\b'],
-        'associate': [r'\bassociate\'?s?\b', r'\ba\.?s\.?\b', r'\ba\.?a\.?\b'],
-        'high_school': [r'\bhigh school\b', r'\bh\.?s\.?\b', r'\bdiploma\b', r'\bged\b'],
-    }
-    
-    for level, patterns in education_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                return level
+    for level, pattern in EDUCATION_PATTERNS.items():
+        if pattern.search(text):
+            return level
     
     return None
 
 
+def _fuzzy_ratio_matrix(job_canonicals, candidate_canonicals, threshold):
+    """
+    Score every job skill against every candidate skill in one call.
+    
+    Args:
+        job_canonicals: List of normalized job skills.
+        candidate_canonicals: List of normalized candidate skills.
+        threshold: Minimum similarity ratio (0-1) for fuzzy matches.
+        
+    Returns:
+        numpy.ndarray: Similarity ratios (0-1) with one row per job skill
+        and one column per candidate skill; ratios below threshold are 0.
+    """
+    if not candidate_canonicals:
+        return np.zeros((len(job_canonicals), 0))
+    
+    ratios = process.cdist(
+        job_canonicals, candidate_canonicals, scorer=fuzz.ratio, dtype=np.float64
+    ) / 100
+    ratios[ratios < threshold] = 0.0
+    return ratios
+
+
+# Number of (job skills, candidate skills) pairs whose match result is memoized
+SKILL_MATCH_CACHE_SIZE = 4096
+
+
 def calculate_skill_match(job_skills, candidate_skills):
     """
     Calculate the percentage of job skills matched by candidate.
     Enhanced with synonym matching, fuzzy matching, and weighted scoring.
+    Results are memoized per process, since the same skill lists are
+    re-matched whenever a job or candidate is matched again.
     
     Args:
         job_skills: List of skills required for the job.
@@ -544,18 +819,47 @@ def calculate_skill_match(job_skills, candidate_skills):
     Returns:
         tuple: (match_percentage, matched_skills_dict)
     """
+    # Keyed on tuples, not sets: input order decides which original
+    # spelling is reported and the order of the returned dict
+    match_percentage, matched_items = _calculate_skill_match_cached(
+        tuple(job_skills),
+        tuple(candidate_skills)
+    )
+    return match_percentage, dict(matched_items)
+
+
+@functools.lru_cache(maxsize=SKILL_MATCH_CACHE_SIZE)
+def _calculate_skill_match_cached(job_skills, candidate_skills):
+    """
+    Memoized body of calculate_skill_match.
+    
+    Args:
+        job_skills: Tuple of skills required for the job.
+        candidate_skills: Tuple of skills the candidate has.
+        
+    Returns:
+        tuple: (match_percentage, matched_skills_items), where the items
+        are a tuple of (skill, matched) pairs so the result is immutable.
+    """
     if not job_skills:
-        return 0.0, {}
+        return 0.0, ()
     
     # Normalize all skills to canonical form
     job_skills_normalized = {normalize_skill(s): s for s in job_skills}
     candidate_skills_normalized = {normalize_skill(s): s for s in candidate_skills}
     
+    # Fuzzy similarity of every job skill to every candidate skill
+    ratios = _fuzzy_ratio_matrix(
+        list(job_skills_normalized),
+        list(candidate_skills_normalized),
+        threshold=0.85
+    )
+    
     matched_skills = {}
     total_weight = 0
     matched_weight = 0
     
-    for canonical, original in job_skills_normalized.items():
+    for row, (canonical, original) in enumerate(job_skills_normalized.items()):
         # Get weight for this skill (default 1.0)
         weight = SKILL_WEIGHTS.get(canonical, 1.0)
         total_weight += weight
@@ -565,13 +869,9 @@ def calculate_skill_match(job_skills, candidate_skills):
             matched_skills[original] = True
             matched_weight += weight
         else:
-            # Try fuzzy matching
-            best_match, ratio = fuzzy_match_skill(
-                canonical, 
-                list(candidate_skills_normalized.keys()),
-                threshold=0.85
-            )
-            if best_match:
+            # Fall back to the best fuzzy match
+            ratio = float(ratios[row].max(initial=0.0))
+            if ratio > 0:
                 matched_skills[original] = True
                 # Partial credit for fuzzy match
                 matched_weight += weight * ratio
@@ -584,7 +884,99 @@ def calculate_skill_match(job_skills, candidate_skills):
     else:
         match_percentage = 0.0
     
-    return round(match_percentage, 2), matched_skills
+    return round(match_percentage, 2), tuple(matched_skills.items())
+
+
+def build_candidate_skill_matrix(candidate_skill_lists):
+    """
+    Build the boolean candidate-by-skill matrix used for bulk matching.
+    
+    Rows are candidates and columns are every distinct canonical skill
+    they have. Build it once and pass it to bulk_calculate_skill_match
+    when scoring several jobs against the same candidates.
+    
+    Args:
+        candidate_skill_lists: List of skill lists, one per candidate.
+        
+    Returns:
+        tuple: (skill_index, candidate_matrix), where skill_index maps each
+        canonical skill to its column.
+    """
+    skill_index = {}
+    rows = []
+    columns = []
+    for row, candidate_skills in enumerate(candidate_skill_lists):
+        for skill in candidate_skills:
+            rows.append(row)
+            columns.append(skill_index.setdefault(normalize_skill(skill), len(skill_index)))
+    
+    candidate_matrix = np.zeros((len(candidate_skill_lists), len(skill_index)), dtype=bool)
+    candidate_matrix[rows, columns] = True
+    
+    return skill_index, candidate_matrix
+
+
+def bulk_calculate_skill_match(job_skills, candidate_skill_lists, threshold=0.85, skill_matrix=None):
+    """
+    Calculate skill matches of one job against many candidates at once.
+    Gives the same results as calling calculate_skill_match per candidate,
+    but scores all candidates with a single boolean skill matrix.
+    
+    Args:
+        job_skills: List of skills required for the job.
+        candidate_skill_lists: List of skill lists, one per candidate.
+        threshold: Minimum similarity ratio (0-1) for fuzzy matches.
+        skill_matrix: Optional result of build_candidate_skill_matrix for
+            candidate_skill_lists, reused instead of rebuilding it.
+        
+    Returns:
+        list: (match_percentage, matched_skills_dict) tuple per candidate,
+        in the same order as candidate_skill_lists.
+    """
+    if not job_skills:
+        return [(0.0, {}) for _ in candidate_skill_lists]
+    
+    job_skills_normalized = {normalize_skill(s): s for s in job_skills}
+    canonicals = list(job_skills_normalized.keys())
+    originals = list(job_skills_normalized.values())
+    weights = np.array([SKILL_WEIGHTS.get(canonical, 1.0) for canonical in canonicals])
+    
+    # np.add.accumulate adds strictly left to right (np.sum is pairwise),
+    # so totals are bit-identical to calculate_skill_match's running sums
+    total_weight = np.add.accumulate(weights)[-1]
+    
+    if skill_matrix is None:
+        skill_matrix = build_candidate_skill_matrix(candidate_skill_lists)
+    skill_index, candidate_matrix = skill_matrix
+    
+    # Fuzzy ratio is a property of the skill pair, so score every job skill
+    # against every distinct candidate skill once rather than per candidate
+    ratios = _fuzzy_ratio_matrix(canonicals, list(skill_index), threshold)
+    
+    # Credit per (candidate, job skill): 1 for exact, ratio for fuzzy, 0 otherwise
+    credits = np.zeros((len(candidate_skill_lists), len(canonicals)))
+    for j, canonical in enumerate(canonicals):
+        fuzzy_columns = np.flatnonzero(ratios[j])
+        if fuzzy_columns.size:
+            credits[:, j] = (candidate_matrix[:, fuzzy_columns] * ratios[j, fuzzy_columns]).max(axis=1)
+        
+        exact_column = skill_index.get(canonical)
+        if exact_column is not None:
+            credits[candidate_matrix[:, exact_column], j] = 1.0
+    
+    # Weighted credit per candidate, summed in job skill order
+    matched_weight = np.add.accumulate(credits * weights, axis=1)[:, -1]
+    
+    if total_weight > 0:
+        match_percentages = (matched_weight / total_weight) * 100
+    else:
+        match_percentages = np.zeros(len(candidate_skill_lists))
+    
+    matched_flags = credits > 0
+    return [
+        (round(float(percentage), 2), dict(zip(originals, flags.tolist())))
+        for percentage, flags in zip(match_percentages, matched_flags)
+    ]
 
 
 def calculate_skill_match_detailed(job_skills, candidate_skills):
@@ -618,10 +1010,18 @@ def calculate_skill_match_detailed(job_skills, candidate_skills):
     fuzzy_matches = []
     skill_details = {}
     
+    # Fuzzy similarity of every job skill to every candidate skill
+    candidate_canonicals = list(candidate_normalized)
+    ratios = _fuzzy_ratio_matrix(
+        list(job_normalized),
+        candidate_canonicals,
+        threshold=0.80
+    )
+    
     total_weight = 0
     matched_weight = 0
     
-    for canonical, original in job_normalized.items():
+    for row, (canonical, original) in enumerate(job_normalized.items()):
         weight = SKILL_WEIGHTS.get(canonical, 1.0)
         total_weight += weight
         
@@ -643,12 +1043,13 @@ def calculate_skill_match_detailed(job_skills, candidate_skills):
             detail['matched_with'] = candidate_normalized[canonical]
             detail['similarity'] = 1.0
         else:
-            # Try fuzzy matching
-            best_match, ratio = fuzzy_match_skill(
-                canonical,
-                list(candidate_normalized.keys()),
-                threshold=0.80
-            )
+            # Fall back to the best fuzzy match (first one on ties)
+            best_match, ratio = None, 0
+            if candidate_canonicals:
+                column = int(ratios[row].argmax())
+                if ratios[row, column] > 0:
+                    best_match = candidate_canonicals[column]
+                    ratio = float(ratios[row, column])
             if best_match:
                 matched.append(original)
                 matched_weight += weight * ratio
@@ -667,15 +1068,13 @@ def calculate_skill_match_detailed(job_skills, candidate_skills):
         skill_details[original] = detail
     
     # Find extra skills candidate has
+    # Skills already matched via fuzzy, for constant-time lookups
+    fuzzy_found = {fm['found'].lower() for fm in fuzzy_matches}
     extra = []
     for canonical, original in candidate_normalized.items():
         if canonical not in job_normalized:
             # Check if not already matched via fuzzy
-            already_matched = any(
-                fm['found'].lower() == original.lower() 
-                for fm in fuzzy_matches
-            )
-            if not already_matched:
+            if original.lower() not in fuzzy_found:
                 extra.append(original)
     
     # Calculate percentages
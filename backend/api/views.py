@@ -8,7 +8,9 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q, Avg, Count
 
 from .models import JobDescription, Candidate, Match
 from .serializers import (
@@ -21,7 +23,89 @@ from .serializers import (
     MatchCreateSerializer,
     BulkMatchSerializer,
 )
-from .utils import calculate_skill_match
+from .utils import (
+    extract_text_from_pdf,
+    extract_skills,
+    extract_experience_years,
+    extract_education_level,
+    calculate_skill_match,
+    calculate_skill_match_detailed,
+    bulk_calculate_skill_match,
+    build_candidate_skill_matrix,
+    normalize_skill,
+    find_highlights,
+    CANONICAL_TO_SYNONYMS,
+)
+from .signals import (
+    DASHBOARD_STATS_CACHE_KEY,
+    DASHBOARD_STATS_CACHE_TIMEOUT,
+    invalidate_dashboard_stats,
+)
+
+
+# Columns refreshed when an existing job/candidate match is recomputed
+MATCH_UPSERT_FIELDS = ['match_percentage', 'keyword_matches', 'semantic_score']
+
+# Rows per INSERT statement when saving matches in bulk
+MATCH_BATCH_SIZE = 1000
+
+# Rows fetched per round trip when streaming jobs through a matching loop
+JOB_ITERATOR_CHUNK_SIZE = 500
+
+# Columns MatchSerializer reads, including the joined job/candidate fields;
+# skips raw_text and the skill JSON on the related rows
+MATCH_SERIALIZER_FIELDS = [
+    'id',
+    'job',
+    'candidate',
+    'match_percentage',
+    'keyword_matches',
+    'semantic_score',
+    'matched_on',
+    'job__title',
+    'job__company_name',
+    'candidate__name',
+    'candidate__email',
+]
+
+
+def _upsert_matches(matches, invalidate=True):
+    """
+    Insert or update Match rows in batched multi-row upserts instead of
+    one update_or_create round trip per job/candidate pair.
+    
+    Args:
+        matches: List of unsaved Match instances.
+        invalidate: Register the dashboard stats invalidation; callers that
+            upsert in a loop pass False and register it once themselves.
+    """
+    Match.objects.bulk_create(
+        matches,
+        update_conflicts=True,
+        unique_fields=['job', 'candidate'],
+        update_fields=MATCH_UPSERT_FIELDS,
+        batch_size=MATCH_BATCH_SIZE,
+    )
+    # bulk_create does not send post_save, so invalidate explicitly, once
+    # the rows are committed so a concurrent poll cannot re-cache old counts
+    if invalidate:
+        transaction.on_commit(invalidate_dashboard_stats)
+
+
+def _not_ready_response(label, obj):
+    """
+    Build the 409 response for a job or candidate whose PDF extraction has
+    not completed, so it has no skills to match yet.
+    
+    Args:
+        label: 'Job' or 'Candidate', used in the error message.
+        obj: The JobDescription or Candidate instance.
+    """
+    if obj.processing_status == 'processing':
+        message = f'{label} is still being processed; try again shortly'
+    else:
+        message = f'{label} text extraction failed; upload a new PDF'
+    return Response({'error': message}, status=status.HTTP_409_CONFLICT)
 
 
 class JobDescriptionViewSet(viewsets.ModelViewSet):
@@ -56,34 +140,43 @@ class JobDescriptionViewSet(viewsets.ModelViewSet):
         Creates or updates Match records for each candidate.
         """
         job = self.get_object()
-        candidates = Candidate.objects.all()
+        if job.processing_status != 'completed':
+            return _not_ready_response('Job', job)
+        
+        # Only processed candidates, and only the columns used for scoring
+        # and the response (skips raw_text)
+        candidates = list(
+            Candidate.objects.filter(processing_status='completed').only('id', 'name', 'skills_extracted')
+        )
+        
+        # Score every candidate against the job in one vectorized pass
+        scores = bulk_calculate_skill_match(
+            job.skills_required,
+            [candidate.skills_extracted for candidate in candidates]
+        )
+        
+        existing_candidate_ids = set(
+            Match.objects.filter(job=job).values_list('candidate_id', flat=True)
+        )
         
+        matches = []
         matches_created = 0
         matches_updated = 0
         results = []
         
-        for candidate in candidates:
-            # Calculate match
-            match_percentage, keyword_matches = calculate_skill_match(
-                job.skills_required,
-                candidate.skills_extracted
-            )
-            
-            # Create or update match record
-            match, created = Match.objects.update_or_create(
+        for candidate, (match_percentage, keyword_matches) in zip(candidates, scores):
+            matches.append(Match(
                 job=job,
                 candidate=candidate,
-                defaults={
-                    'match_percentage': match_percentage,
-                    'keyword_matches': keyword_matches,
-                    'semantic_score': 0.0,  # Will be updated with NLP later
-                }
-            )
+                match_percentage=match_percentage,
+                keyword_matches=keyword_matches,
+                semantic_score=0.0,  # Will be updated with NLP later
+            ))
             
-            if created:
-                matches_created += 1
-            else:
+            if candidate.id in existing_candidate_ids:
                 matches_updated += 1
+            else:
+                matches_created += 1
             
             results.append({
                 'candidate_id': candidate.id,
@@ -92,6 +185,8 @@ class JobDescriptionViewSet(viewsets.ModelViewSet):
                 'matched_skills': [k for k, v in keyword_matches.items() if v],
             })
         
+        _upsert_matches(matches)
+        
         # Sort by match percentage descending
         results.sort(key=lambda x: x['match_percentage'], reverse=True)
         
@@ -113,23 +208,34 @@ class JobDescriptionViewSet(viewsets.ModelViewSet):
         limit = int(request.query_params.get('limit', 10))
         min_match = float(request.query_params.get('min_match', 0))
         
+        # Fetch only the needed columns as plain rows, joined to the candidate
         matches = Match.objects.filter(
             job=job,
             match_percentage__gte=min_match
-        ).select_related('candidate').order_by('-match_percentage')[:limit]
-        
-        results = []
-        for match in matches:
-            results.append({
-                'candidate_id': match.candidate.id,
-                'candidate_name': match.candidate.name,
-                'candidate_email': match.candidate.email,
-                'match_percentage': match.match_percentage,
-                'semantic_score': match.semantic_score,
-                'matched_skills': [k for k, v in match.keyword_matches.items() if v],
-                'experience_years': match.candidate.experience_years,
-                'education_level': match.candidate.education_level,
-            })
+        ).order_by('-match_percentage').values(
+            'candidate_id',
+            'candidate__name',
+            'candidate__email',
+            'match_percentage',
+            'semantic_score',
+            'keyword_matches',
+            'candidate__experience_years',
+            'candidate__education_level',
+        )[:limit]
+        
+        results = [
+            {
+                'candidate_id': match['candidate_id'],
+                'candidate_name': match['candidate__name'],
+                'candidate_email': match['candidate__email'],
+                'match_percentage': match['match_percentage'],
+                'semantic_score': match['semantic_score'],
+                'matched_skills': [k for k, v in match['keyword_matches'].items() if v],
+                'experience_years': match['candidate__experience_years'],
+                'education_level': match['candidate__education_level'],
+            }
+            for match in matches
+        ]
         
         return Response({
             'job_id': job.id,
@@ -173,23 +279,34 @@ class CandidateViewSet(viewsets.ModelViewSet):
         min_match = float(request.query_params.get('min_match', 0))
         
         # Get existing matches
+        # Fetch only the needed columns as plain rows, joined to the job
         matches = Match.objects.filter(
             candidate=candidate,
             match_percentage__gte=min_match
-        ).select_related('job').order_by('-match_percentage')[:limit]
-        
-        results = []
-        for match in matches:
-            results.append({
-                'job_id': match.job.id,
-                'job_title': match.job.title,
-                'company_name': match.job.company_name,
-                'location': match.job.location,
-                'match_percentage': match.match_percentage,
-                'semantic_score': match.semantic_score,
-                'matched_skills': [k for k, v in match.keyword_matches.items() if v],
-                'required_experience': match.job.experience_years,
-            })
+        ).order_by('-match_percentage').values(
+            'job_id',
+            'job__title',
+            'job__company_name',
+            'job__location',
+            'match_percentage',
+            'semantic_score',
+            'keyword_matches',
+            'job__experience_years',
+        )[:limit]
+        
+        results = [
+            {
+                'job_id': match['job_id'],
+                'job_title': match['job__title'],
+                'company_name': match['job__company_name'],
+                'location': match['job__location'],
+                'match_percentage': match['match_percentage'],
+                'semantic_score': match['semantic_score'],
+                'matched_skills': [k for k, v in match['keyword_matches'].items() if v],
+                'required_experience': match['job__experience_years'],
+            }
+            for match in matches
+        ]
         
         return Response({
             'candidate_id': candidate.id,
@@ -212,32 +329,40 @@ class CandidateViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        jobs = JobDescription.objects.all()
+        if candidate.processing_status != 'completed':
+            return _not_ready_response('Candidate', candidate)
         
+        jobs = JobDescription.objects.filter(processing_status='completed').only(
+            'id', 'title', 'company_name', 'skills_required'
+        )
+        existing_job_ids = set(
+            Match.objects.filter(candidate=candidate).values_list('job_id', flat=True)
+        )
+        
+        matches = []
         matches_created = 0
         matches_updated = 0
         results = []
         
-        for job in jobs:
+        # Stream jobs; matches keep only the job id so rows can be freed
+        for job in jobs.iterator(chunk_size=JOB_ITERATOR_CHUNK_SIZE):
             match_percentage, keyword_matches = calculate_skill_match(
                 job.skills_required,
                 candidate.skills_extracted
             )
             
-            match, created = Match.objects.update_or_create(
-                job=job,
+            matches.append(Match(
+                job_id=job.id,
                 candidate=candidate,
-                defaults={
-                    'match_percentage': match_percentage,
-                    'keyword_matches': keyword_matches,
-                    'semantic_score': 0.0,
-                }
-            )
+                match_percentage=match_percentage,
+                keyword_matches=keyword_matches,
+                semantic_score=0.0,
+            ))
             
-            if created:
-                matches_created += 1
-            else:
+            if job.id in existing_job_ids:
                 matches_updated += 1
+            else:
+                matches_created += 1
             
             results.append({
                 'job_id': job.id,
@@ -246,12 +371,14 @@ class CandidateViewSet(viewsets.ModelViewSet):
                 'match_percentage': match_percentage,
             })
         
+        _upsert_matches(matches)
+        
         results.sort(key=lambda x: x['match_percentage'], reverse=True)
         
         return Response({
             'candidate_id': candidate.id,
             'candidate_name': candidate.name,
-            'total_jobs': len(jobs),
+            'total_jobs': len(results),
             'matches_created': matches_created,
             'matches_updated': matches_updated,
             'results': results,
@@ -275,6 +402,23 @@ class MatchViewSet(viewsets.ModelViewSet):
     ordering_fields = ['match_percentage', 'semantic_score', 'matched_on']
     ordering = ['-match_percentage']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Only load the columns MatchListSerializer reads; skips raw_text
+            # and the skill JSON on the joined job/candidate rows.
+            queryset = queryset.only(
+                'id',
+                'match_percentage',
+                'semantic_score',
+                'matched_on',
+                'job__title',
+                'candidate__name',
+            )
+        elif self.action == 'retrieve':
+            queryset = queryset.only(*MATCH_SERIALIZER_FIELDS)
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'list':
             return MatchListSerializer
@@ -292,7 +436,9 @@ class MatchViewSet(viewsets.ModelViewSet):
         
         matches = Match.objects.filter(
             match_percentage__gte=min_match
-        ).select_related('job', 'candidate').order_by('-match_percentage')[:limit]
+        ).select_related('job', 'candidate').only(
+            *MATCH_SERIALIZER_FIELDS
+        ).order_by('-match_percentage')[:limit]
         
         serializer = MatchSerializer(matches, many=True)
         return Response(serializer.data)
@@ -312,7 +458,9 @@ class MatchViewSet(viewsets.ModelViewSet):
         
         matches = Match.objects.filter(
             job_id=job_id
-        ).select_related('candidate').order_by('-match_percentage')
+        ).select_related('job', 'candidate').only(
+            *MATCH_SERIALIZER_FIELDS
+        ).order_by('-match_percentage')
         
         serializer = MatchSerializer(matches, many=True)
         return Response(serializer.data)
@@ -332,7 +480,9 @@ class MatchViewSet(viewsets.ModelViewSet):
         
         matches = Match.objects.filter(
             candidate_id=candidate_id
-        ).select_related('job').order_by('-match_percentage')
+        ).select_related('job', 'candidate').only(
+            *MATCH_SERIALIZER_FIELDS
+        ).order_by('-match_percentage')
         
         serializer = MatchSerializer(matches, many=True)
         return Response(serializer.data)
@@ -341,33 +491,48 @@ class MatchViewSet(viewsets.ModelViewSet):
     def bulk_create(self, request):
         """
         Create matches for all job-candidate combinations.
+        Jobs and candidates whose extraction has not completed are skipped.
         """
-        jobs = JobDescription.objects.all()
-        candidates = Candidate.objects.all()
+        # Only the skill lists are needed for scoring (skips raw_text)
+        jobs = JobDescription.objects.filter(processing_status='completed').only('id', 'skills_required')
+        candidates = list(
+            Candidate.objects.filter(processing_status='completed').only('id', 'skills_extracted')
+        )
+        candidate_skill_lists = [candidate.skills_extracted for candidate in candidates]
         
+        # Candidate skills are the same for every job, so normalize them once
+        skill_matrix = build_candidate_skill_matrix(candidate_skill_lists)
+        
+        total_jobs = 0
         total_matches = 0
         
-        for job in jobs:
-            for candidate in candidates:
-                match_percentage, keyword_matches = calculate_skill_match(
+        with transaction.atomic():
+            # Stream jobs instead of caching every instance; count as we go
+            for job in jobs.iterator(chunk_size=JOB_ITERATOR_CHUNK_SIZE):
+                scores = bulk_calculate_skill_match(
                     job.skills_required,
-                    candidate.skills_extracted
+                    candidate_skill_lists,
+                    skill_matrix=skill_matrix,
                 )
                 
-                Match.objects.update_or_create(
-                    job=job,
-                    candidate=candidate,
-                    defaults={
-                        'match_percentage': match_percentage,
-                        'keyword_matches': keyword_matches,
-                        'semantic_score': 0.0,
-                    }
-                )
-                total_matches += 1
+                _upsert_matches([
+                    Match(
+                        job=job,
+                        candidate=candidate,
+                        match_percentage=match_percentage,
+                        keyword_matches=keyword_matches,
+                        semantic_score=0.0,
+                    )
+                    for candidate, (match_percentage, keyword_matches) in zip(candidates, scores)
+                ], invalidate=False)
+                total_jobs += 1
+                total_matches += len(candidates)
+            
+            transaction.on_commit(invalidate_dashboard_stats)
         
         return Response({
             'message': 'Bulk matching completed',
-            'total_jobs': len(jobs),
+            'total_jobs': total_jobs,
             'total_candidates': len(candidates),
             'total_matches': total_matches,
         })
@@ -383,19 +548,33 @@ class DashboardViewSet(viewsets.ViewSet):
     def stats(self, request):
         """
         Get dashboard statistics.
+        
+        Results are cached briefly and invalidated whenever a job,
+        candidate, or match changes (see signals.py).
+        """
+        data = cache.get_or_set(
+            DASHBOARD_STATS_CACHE_KEY,
+            self._compute_stats,
+            DASHBOARD_STATS_CACHE_TIMEOUT,
+        )
+        return Response(data)
+    
+    def _compute_stats(self):
+        """
+        Run the dashboard statistics queries.
         """
         total_jobs = JobDescription.objects.count()
         total_candidates = Candidate.objects.count()
-        total_matches = Match.objects.count()
-        
-        # Top matches
-        top_matches = Match.objects.filter(
-            match_percentage__gte=70
-        ).count()
         
-        # Average match percentage
-        from django.db.models import Avg
-        avg_match = Match.objects.aggregate(avg=Avg('match_percentage'))['avg'] or 0
+        # Match totals, top matches and average in a single query
+        match_stats = Match.objects.aggregate(
+            total=Count('id'),
+            top=Count('id', filter=Q(match_percentage__gte=70)),
+            avg=Avg('match_percentage'),
+        )
+        total_matches = match_stats['total']
+        top_matches = match_stats['top']
+        avg_match = match_stats['avg'] or 0
         
         # Recent jobs
         recent_jobs = JobDescription.objects.order_by('-created_at')[:5]
@@ -405,7 +584,7 @@ class DashboardViewSet(viewsets.ViewSet):
         recent_candidates = Candidate.objects.order_by('-created_at')[:5]
         recent_candidates_data = CandidateListSerializer(recent_candidates, many=True).data
         
-        return Response({
+        return {
             'total_jobs': total_jobs,
             'total_candidates': total_candidates,
             'total_matches': total_matches,
@@ -413,7 +592,7 @@ class DashboardViewSet(viewsets.ViewSet):
             'average_match_percentage': round(avg_match, 2),
             'recent_jobs': recent_jobs_data,
             'recent_candidates': recent_candidates_data,
-        })
+        }
 
 
 class CVScoreCheckerViewSet(viewsets.ViewSet):
@@ -436,6 +615,10 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
         - required_skills: Comma-separated list of required skills
         - experience_years: Required years of experience
         - job_description: Optional job description text
+        - include_cv_text: Set to true to include the extracted CV text
+          in the response (default false)
+        - include_cv_skills: Set to false to skip CV skill extraction when
+          no skills are required (default true)
         
         Returns:
         - match_percentage: Overall match score (simple)
@@ -444,22 +627,11 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
         - missing_skills: List of skills not found in CV
         - fuzzy_matches: Skills matched via fuzzy matching
         - cv_skills: All skills extracted from CV
-        - cv_text: Extracted text from CV with match positions
+        - cv_text: Extracted text from CV (only if include_cv_text is true)
         - experience_match: Whether experience requirement is met
         - highlights: Positions of matched keywords for highlighting
         - skill_details: Detailed breakdown for each skill
         """
-        from .utils import (
-            extract_text_from_pdf,
-            extract_skills,
-            extract_experience_years,
-            extract_education_level,
-            calculate_skill_match_detailed,
-            normalize_skill,
-            CANONICAL_TO_SYNONYMS,
-        )
-        import re
-        
         # Get the uploaded CV file
         cv_file = request.FILES.get('cv_file')
         if not cv_file:
@@ -473,6 +645,8 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
         required_skills_str = request.data.get('required_skills', '')
         required_experience = int(request.data.get('experience_years', 0))
         job_description = request.data.get('job_description', '')
+        include_cv_text = str(request.data.get('include_cv_text', '')).lower() == 'true'
+        include_cv_skills = str(request.data.get('include_cv_skills', 'true')).lower() != 'false'
         
         # Parse required skills from comma-separated string
         if required_skills_str:
@@ -497,8 +671,12 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Extract information from CV
-        cv_skills = extract_skills(cv_text)
+        # Extract information from CV; without required skills the CV skills
+        # only feed the extras list, so clients may skip that pass
+        if all_required_skills or include_cv_skills:
+            cv_skills = extract_skills(cv_text)
+        else:
+            cv_skills = []
         cv_experience = extract_experience_years(cv_text)
         cv_education = extract_education_level(cv_text)
         
@@ -518,83 +696,54 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
         experience_match = cv_experience >= required_experience if required_experience > 0 else True
         experience_score = min(100, (cv_experience / required_experience * 100)) if required_experience > 0 else 100
         
-        # Find highlight positions for matched keywords in CV text
-        highlights = []
-        cv_text_lower = cv_text.lower()
+        # Terms to highlight in CV text, in priority order
+        # (skill_match > fuzzy_match > extra_skill); the first entry for a
+        # term wins
+        highlight_terms = {}
         
         # Highlight matched skills - including synonyms
         for skill in matched_skills:
             # Get the canonical form and all synonyms
             canonical = normalize_skill(skill)
-            synonyms = CANONICAL_TO_SYNONYMS.get(canonical, set())
-            synonyms.add(skill.lower())
-            synonyms.add(canonical.lower())
+            synonyms = CANONICAL_TO_SYNONYMS.get(canonical, frozenset()) | {
+                skill.lower(),
+                canonical.lower(),
+            }
             
             for variant in synonyms:
                 if len(variant) < 2:
                     continue  # Skip very short patterns
-                pattern = r'\b' + re.escape(variant) + r'\b'
-                for match in re.finditer(pattern, cv_text_lower, re.IGNORECASE):
-                    highlights.append({
-                        'start': match.start(),
-                        'end': match.end(),
-                        'text': cv_text[match.start():match.end()],
-                        'type': 'skill_match',
-                        'skill': skill,
-                        'canonical': canonical,
-                    })
+                highlight_terms.setdefault(variant, {
+                    'type': 'skill_match',
+                    'skill': skill,
+                    'canonical': canonical,
+                })
         
         # Highlight fuzzy matched skills
         for fuzzy in fuzzy_matches:
-            required = fuzzy['required']
-            found = fuzzy['found']
-            similarity = fuzzy['similarity']
-            found_lower = found.lower()
-            pattern = r'\b' + re.escape(found_lower) + r'\b'
-            for match in re.finditer(pattern, cv_text_lower, re.IGNORECASE):
-                highlights.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'text': cv_text[match.start():match.end()],
-                    'type': 'fuzzy_match',
-                    'skill': required,
-                    'matched_as': found,
-                    'similarity': round(similarity, 2),
-                })
+            highlight_terms.setdefault(fuzzy['found'].lower(), {
+                'type': 'fuzzy_match',
+                'skill': fuzzy['required'],
+                'matched_as': fuzzy['found'],
+                'similarity': round(fuzzy['similarity'], 2),
+            })
         
         # Highlight extra skills (in CV but not required)
         for skill in extra_skills:
-            skill_lower = skill.lower()
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            for match in re.finditer(pattern, cv_text_lower, re.IGNORECASE):
-                highlights.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'text': cv_text[match.start():match.end()],
-                    'type': 'extra_skill',
-                    'skill': skill,
-                })
-        
-        # Sort highlights by position
-        highlights.sort(key=lambda x: x['start'])
-        
-        # Remove overlapping highlights (prefer skill_match > fuzzy_match > extra_skill)
-        type_priority = {'skill_match': 0, 'fuzzy_match': 1, 'extra_skill': 2}
-        highlights.sort(key=lambda x: (x['start'], type_priority.get(x['type'], 99)))
+            highlight_terms.setdefault(skill.lower(), {
+                'type': 'extra_skill',
+                'skill': skill,
+            })
         
-        filtered_highlights = []
-        last_end = -1
-        for h in highlights:
-            if h['start'] >= last_end:
-                filtered_highlights.append(h)
-                last_end = h['end']
+        # Non-overlapping highlight positions, found in a single scan
+        filtered_highlights = find_highlights(cv_text, highlight_terms)
         
         # Calculate overall score combining skills and experience
         skill_weight = 0.8
         experience_weight = 0.2
         overall_score = (match_result['weighted_percentage'] * skill_weight) + (experience_score * experience_weight)
         
-        return Response({
+        response_data = {
             'job_title': job_title,
             'overall_score': round(overall_score, 2),
             'match_percentage': match_result['match_percentage'],
@@ -610,7 +759,6 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
             'required_experience_years': required_experience,
             'experience_match': experience_match,
             'experience_score': round(experience_score, 2),
-            'cv_text': cv_text,
             'highlights': filtered_highlights,
             'total_skills_found': len(cv_skills),
             'total_skills_matched': len(matched_skills),
@@ -625,4 +773,10 @@ class CVScoreCheckerViewSet(viewsets.ViewSet):
                     'experience_scoring'
                 ]
             }
-        })
+        }
+        
+        # The full text is only sent to clients that ask for it
+        if include_cv_text:
+            response_data['cv_text'] = cv_text
+        
+        return Response(response_data)
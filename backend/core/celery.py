@@ -0,0 +1,16 @@
+"""
+Celery configuration for core project.
+
+Tasks are discovered from each installed app's tasks.py module.
+Settings are read from Django settings using the CELERY_ prefix.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+app = Celery('core')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
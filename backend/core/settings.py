@@ -95,6 +95,38 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Uses Redis when REDIS_URL is set so cached values are shared across workers
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Celery (background PDF processing)
+# https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+# Without a broker, tasks run inline within the request
+
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', '')
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # PDF tasks are long and CPU-heavy
+CELERY_TASK_ROUTES = {
+    'api.tasks.process_job_pdf': {'queue': 'pdf'},
+    'api.tasks.process_candidate_cv': {'queue': 'pdf'},
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -23,6 +23,13 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST', '/cloudsql/' + os.environ.get('CLOUD_SQL_CONNECTION_NAME', '')),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        # Matching loops stream rows through server-side cursors, which a
+        # transaction-pooling pgbouncer cannot keep open; set this to true
+        # when running behind one
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower() == 'true',
     }
 }
 
@@ -49,14 +56,29 @@ SESSION_COOKIE_SECURE = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
 # Static files with WhiteNoise
+# collectstatic writes hashed names plus gzip and brotli variants, and
+# WhiteNoise serves hashed files with a far-future immutable Cache-Control
 MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+WHITENOISE_USE_FINDERS = False
+WHITENOISE_AUTOREFRESH = False
 
 # Google Cloud Storage for media files (optional)
 if os.environ.get('GCS_BUCKET_NAME'):
-    DEFAULT_FILE_STORAGE = 'storages.backends.gcloud.GoogleCloudStorage'
-    GS_BUCKET_NAME = os.environ.get('GCS_BUCKET_NAME')
-    GS_DEFAULT_ACL = 'publicRead'
+    STORAGES['default'] = {
+        'BACKEND': 'storages.backends.gcloud.GoogleCloudStorage',
+        'OPTIONS': {
+            'bucket_name': os.environ.get('GCS_BUCKET_NAME'),
+            'default_acl': 'publicRead',
+        },
+    }
 else:
     # Local media storage fallback
     MEDIA_URL = '/media/'
@@ -98,3 +120,9 @@ REST_FRAMEWORK['DEFAULT_PERMISSION_CLASSES'] = [
 
 # Disable pagination for simpler API
 REST_FRAMEWORK['DEFAULT_PAGINATION_CLASS'] = None
+
+# Render JSON responses with orjson
+REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+    'api.renderers.ORJSONRenderer',
+    'rest_framework.renderers.BrowsableAPIRenderer',
+]
@@ -68,8 +68,8 @@ export default function CandidateDetail() {
       setMatching(true);
       const result = await candidatesApi.matchAllJobs(candidate.id);
       setMatchResults(result.results);
-    } catch (err) {
-      alert('Failed to match jobs');
+    } catch (err: any) {
+      alert(err.response?.data?.error || 'Failed to match jobs');
       console.error(err);
     } finally {
       setMatching(false);
@@ -206,7 +206,7 @@ export default function CandidateDetail() {
           <h3 className="text-lg font-semibold text-gray-900">Job Matching</h3>
           <button
             onClick={handleMatchJobs}
-            disabled={matching}
+            disabled={matching || candidate.processing_status !== 'completed'}
             className="inline-flex items-center px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors disabled:opacity-50"
           >
             {matching ? (
@@ -21,6 +21,9 @@ import {
 import { candidatesApi } from '../services/api';
 import type { CandidateListItem, CandidateCreateData } from '../types';
 
+// How often to re-check uploads that are still being processed
+const PROCESSING_POLL_INTERVAL_MS = 3000;
+
 export default function Candidates() {
   const [candidates, setCandidates] = useState<CandidateListItem[]>([]);
   const [loading, setLoading] = useState(true);
@@ -32,6 +35,21 @@ export default function Candidates() {
     loadCandidates();
   }, []);
 
+  // Refresh quietly while any upload is still being processed in the background
+  useEffect(() => {
+    if (!candidates.some((candidate) => candidate.processing_status === 'processing')) return;
+
+    const timer = setTimeout(async () => {
+      try {
+        setCandidates(await candidatesApi.getAll());
+      } catch (err) {
+        console.error(err);
+      }
+    }, PROCESSING_POLL_INTERVAL_MS);
+
+    return () => clearTimeout(timer);
+  }, [candidates]);
+
   const loadCandidates = async () => {
     try {
       setLoading(true);
@@ -65,8 +83,8 @@ export default function Candidates() {
         `Matched ${result.total_jobs} jobs!\n` +
           `Created: ${result.matches_created}, Updated: ${result.matches_updated}`
       );
-    } catch (err) {
-      alert('Failed to match jobs');
+    } catch (err: any) {
+      alert(err.response?.data?.error || 'Failed to match jobs');
       console.error(err);
     }
   };
@@ -231,12 +249,24 @@ function CandidateCard({
       </div>
 
       <div className="mt-4 flex items-center justify-between">
-        <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800">
-          {candidate.skills_count} skills
-        </span>
+        {candidate.processing_status === 'processing' ? (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-yellow-100 text-yellow-800">
+            <Loader2 className="w-3 h-3 mr-1 animate-spin" />
+            Processing
+          </span>
+        ) : candidate.processing_status === 'failed' ? (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-red-100 text-red-800">
+            Extraction failed
+          </span>
+        ) : (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800">
+            {candidate.skills_count} skills
+          </span>
+        )}
         <button
           onClick={() => onMatch(candidate.id)}
-          className="inline-flex items-center text-sm text-blue-600 hover:text-blue-700"
+          disabled={candidate.processing_status !== 'completed'}
+          className="inline-flex items-center text-sm text-blue-600 hover:text-blue-700 disabled:opacity-50 disabled:cursor-not-allowed"
         >
           <Briefcase className="w-4 h-4 mr-1" />
           Match Jobs
@@ -66,8 +66,8 @@ export default function JobDetail() {
       setMatching(true);
       const result = await jobsApi.matchCandidates(job.id);
       setMatchResults(result.results);
-    } catch (err) {
-      alert('Failed to match candidates');
+    } catch (err: any) {
+      alert(err.response?.data?.error || 'Failed to match candidates');
       console.error(err);
     } finally {
       setMatching(false);
@@ -187,7 +187,7 @@ export default function JobDetail() {
           </h3>
           <button
             onClick={handleMatchCandidates}
-            disabled={matching}
+            disabled={matching || job.processing_status !== 'completed'}
             className="inline-flex items-center px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors disabled:opacity-50"
           >
             {matching ? (
@@ -20,6 +20,9 @@ import {
 import { jobsApi } from '../services/api';
 import type { JobDescriptionListItem, JobCreateData } from '../types';
 
+// How often to re-check uploads that are still being processed
+const PROCESSING_POLL_INTERVAL_MS = 3000;
+
 export default function Jobs() {
   const [jobs, setJobs] = useState<JobDescriptionListItem[]>([]);
   const [loading, setLoading] = useState(true);
@@ -31,6 +34,21 @@ export default function Jobs() {
     loadJobs();
   }, []);
 
+  // Refresh quietly while any upload is still being processed in the background
+  useEffect(() => {
+    if (!jobs.some((job) => job.processing_status === 'processing')) return;
+
+    const timer = setTimeout(async () => {
+      try {
+        setJobs(await jobsApi.getAll());
+      } catch (err) {
+        console.error(err);
+      }
+    }, PROCESSING_POLL_INTERVAL_MS);
+
+    return () => clearTimeout(timer);
+  }, [jobs]);
+
   const loadJobs = async () => {
     try {
       setLoading(true);
@@ -64,8 +82,8 @@ export default function Jobs() {
         `Matched ${result.total_candidates} candidates!\n` +
           `Created: ${result.matches_created}, Updated: ${result.matches_updated}`
       );
-    } catch (err) {
-      alert('Failed to match candidates');
+    } catch (err: any) {
+      alert(err.response?.data?.error || 'Failed to match candidates');
       console.error(err);
     }
   };
@@ -202,12 +220,24 @@ function JobCard({ job, onDelete, onMatch }: JobCardProps) {
       </div>
 
       <div className="mt-4 flex items-center justify-between">
-        <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-blue-100 text-blue-800">
-          {job.skills_count} skills
-        </span>
+        {job.processing_status === 'processing' ? (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-yellow-100 text-yellow-800">
+            <Loader2 className="w-3 h-3 mr-1 animate-spin" />
+            Processing
+          </span>
+        ) : job.processing_status === 'failed' ? (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-red-100 text-red-800">
+            Extraction failed
+          </span>
+        ) : (
+          <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-blue-100 text-blue-800">
+            {job.skills_count} skills
+          </span>
+        )}
         <button
           onClick={() => onMatch(job.id)}
-          className="inline-flex items-center text-sm text-blue-600 hover:text-blue-700"
+          disabled={job.processing_status !== 'completed'}
+          className="inline-flex items-center text-sm text-blue-600 hover:text-blue-700 disabled:opacity-50 disabled:cursor-not-allowed"
         >
           <Users className="w-4 h-4 mr-1" />
           Match Candidates
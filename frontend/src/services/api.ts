@@ -264,7 +264,7 @@ export interface CVScoreResult {
   required_experience_years: number;
   experience_match: boolean;
   experience_score?: number;
-  cv_text: string;
+  cv_text?: string;
   highlights: CVScoreHighlight[];
   total_skills_found: number;
   total_skills_matched: number;
@@ -284,6 +284,8 @@ export const cvCheckerApi = {
     if (data.job_description) {
       formData.append('job_description', data.job_description);
     }
+    // The highlighted CV view needs the extracted text
+    formData.append('include_cv_text', 'true');
 
     const response = await api.post('/cv-checker/check_score/', formData, {
       headers: { 'Content-Type': 'multipart/form-data' },
@@ -12,6 +12,7 @@ export interface JobDescription {
   raw_text: string;
   skills_required: string[];
   experience_years: number;
+  processing_status: 'processing' | 'completed' | 'failed';
   created_at: string;
 }
 
@@ -22,6 +23,7 @@ export interface JobDescriptionListItem {
   location?: string;
   experience_years: number;
   skills_count: number;
+  processing_status: 'processing' | 'completed' | 'failed';
   created_at: string;
 }
 
@@ -44,6 +46,7 @@ export interface Candidate {
   skills_extracted: string[];
   experience_years: number;
   education_level?: string;
+  processing_status: 'processing' | 'completed' | 'failed';
   created_at: string;
   updated_at: string;
 }
@@ -56,6 +59,7 @@ export interface CandidateListItem {
   experience_years: number;
   education_level?: string;
   skills_count: number;
+  processing_status: 'processing' | 'completed' | 'failed';
   created_at: string;
 }
 